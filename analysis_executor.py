@@ -0,0 +1,207 @@
+import os
+import sys
+import types
+import atexit
+import hashlib
+import threading
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from contextlib import contextmanager
+
+MAX_PUBLISHED_DATASETS = 4
+
+# Column layout of a published dataset
+LAT, LNG, SALARY = 0, 1, 2
+
+def _attach(descriptor):
+    """Map a published dataset into this worker without copying it"""
+    name, shape = descriptor
+    shm = shared_memory.SharedMemory(name=name, track=False)
+    return shm, np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+def task_cluster(descriptor, eps=0.5, min_samples=3):
+    """DBSCAN labels over (lat, lng)"""
+    from sklearn.cluster import DBSCAN
+    shm, points = _attach(descriptor)
+    try:
+        return DBSCAN(eps=eps, min_samples=min_samples).fit(points[:, [LAT, LNG]]).labels_
+    finally:
+        del points
+        shm.close()
+
+def task_salary_gradient(descriptor, center_lat, center_lng, max_radius=100):
+    """Row indices and distances of jobs within max_radius km of the center"""
+    from gis_utils import haversine_km
+    shm, points = _attach(descriptor)
+    try:
+        distance = haversine_km(center_lat, center_lng, points[:, LAT], points[:, LNG])
+        rows = np.flatnonzero(distance <= max_radius)
+        return rows, distance[rows]
+    finally:
+        del points
+        shm.close()
+
+def task_hub_overlap(descriptor, hubs):
+    """Job count and mean salary inside each hub geometry"""
+    import shapely
+    from shapely.geometry import shape
+    shm, points = _attach(descriptor)
+    try:
+        results = []
+        for hub in hubs:
+            inside = shapely.contains_xy(shape(hub['geometry']), points[:, LNG], points[:, LAT])
+            salaries = points[inside, SALARY]
+            results.append({
+                'hub_name': hub['name'],
+                'job_count': int(inside.sum()),
+                'avg_salary': float(salaries.mean()) if len(salaries) else 0
+            })
+        return results
+    finally:
+        del points
+        shm.close()
+
+def task_salary_raster(descriptor, bounds, bins=(50, 50)):
+    """Job count and mean salary grids over bounds = (min_lat, min_lng, max_lat, max_lng)"""
+    shm, points = _attach(descriptor)
+    try:
+        min_lat, min_lng, max_lat, max_lng = bounds
+        value_range = [[min_lat, max_lat], [min_lng, max_lng]]
+        counts, _, _ = np.histogram2d(points[:, LAT], points[:, LNG], bins=bins, range=value_range)
+        totals, _, _ = np.histogram2d(points[:, LAT], points[:, LNG], bins=bins, range=value_range,
+                                      weights=points[:, SALARY])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_salary = np.where(counts > 0, totals / counts, np.nan)
+        return counts, mean_salary
+    finally:
+        del points
+        shm.close()
+
+def _started():
+    """No-op task that makes the pool start a worker"""
+    return True
+
+@contextmanager
+def _detached_main():
+    """Start workers against an empty ``__main__``.
+
+    Streamlit installs the running script as ``__main__``, and spawn would
+    re-execute it in every new worker. Workers only need this module.
+    """
+    main = sys.modules['__main__']
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        yield
+    finally:
+        sys.modules['__main__'] = main
+
+TASKS = {
+    "cluster": task_cluster,
+    "salary_gradient": task_salary_gradient,
+    "hub_overlap": task_hub_overlap,
+    "salary_raster": task_salary_raster,
+}
+
+class AnalysisExecutor:
+    """Runs heavy analyses in a process pool, off the Streamlit script thread.
+
+    Jobs are published once as a float64 (lat, lng, salary) array in shared
+    memory, and workers map it instead of unpickling document lists.
+    Identical requests (same task, dataset and parameters) share one future,
+    so concurrent sessions asking for the same result do the work once.
+    Callers get a key back and poll ``status``/``result`` with it.
+    """
+
+    def __init__(self, max_workers=None):
+        max_workers = max_workers or os.cpu_count() or 1
+        # Spawn reads __main__ when a worker starts, so start them all here,
+        # once, rather than letting submit() start them while sessions run
+        with _detached_main():
+            self.pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            for _ in range(max_workers):
+                self.pool.submit(_started)
+        self._lock = threading.Lock()
+        self._datasets = {}
+        self._futures = {}
+        atexit.register(self.shutdown)
+
+    def publish(self, jobs):
+        """Copy job coordinates and salaries into shared memory; returns the dataset key"""
+        if hasattr(jobs, "column"):
+            # Columnar JobTable: hash and copy whole columns, no per-row dicts
+            dataset_key = hashlib.sha1(jobs.column("_id").tobytes()).hexdigest()
+        else:
+            dataset_key = hashlib.sha1(
+                "".join(str(job['_id']) for job in jobs).encode()
+            ).hexdigest()
+
+        with self._lock:
+            if dataset_key in self._datasets:
+                return dataset_key
+
+            if hasattr(jobs, "column"):
+                points = np.column_stack([jobs.column("lat"), jobs.column("lng"), jobs.column("salary")]
+                                         ).astype(np.float64).reshape(-1, 3)
+            else:
+                points = np.array(
+                    [[job['coordinates'][1], job['coordinates'][0], job['salary']] for job in jobs],
+                    dtype=np.float64
+                ).reshape(-1, 3)
+            shm = shared_memory.SharedMemory(create=True, size=max(points.nbytes, 1))
+            np.ndarray(points.shape, dtype=np.float64, buffer=shm.buf)[:] = points
+            self._datasets[dataset_key] = (shm, points.shape)
+            self._evict_datasets()
+        return dataset_key
+
+    def _evict_datasets(self):
+        # Keep the newest datasets, but never one an unfinished task still reads
+        busy = {key[1] for key, future in self._futures.items() if not future.done()}
+        for dataset_key in list(self._datasets)[:-MAX_PUBLISHED_DATASETS]:
+            if dataset_key not in busy:
+                shm, _ = self._datasets.pop(dataset_key)
+                shm.close()
+                shm.unlink()
+                for key in [k for k in self._futures if k[1] == dataset_key]:
+                    del self._futures[key]
+
+    def submit(self, task, dataset_key, **params):
+        """Queue a task unless an identical one is in flight or done; returns its key"""
+        key = (task, dataset_key, repr(sorted(params.items())))
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None or future.cancelled() or (future.done() and future.exception()):
+                if dataset_key not in self._datasets:
+                    raise KeyError(f"dataset {dataset_key} is no longer published; publish the jobs again")
+                shm, shape = self._datasets[dataset_key]
+                self._futures[key] = self.pool.submit(TASKS[task], (shm.name, shape), **params)
+        return key
+
+    def status(self, key):
+        """'pending', 'running', 'done' or 'failed'"""
+        future = self._futures.get(key)
+        if future is None:
+            return "failed"
+        if future.running():
+            return "running"
+        if not future.done():
+            return "pending"
+        return "failed" if future.exception() else "done"
+
+    def result(self, key, timeout=None):
+        """Block for a task's result; re-raises the worker's exception"""
+        return self._futures[key].result(timeout=timeout)
+
+    def shutdown(self):
+        """Stop the workers and release all shared memory"""
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            for shm, _ in self._datasets.values():
+                shm.close()
+                shm.unlink()
+            self._datasets.clear()
+            self._futures.clear()
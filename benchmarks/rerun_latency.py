@@ -0,0 +1,63 @@
+"""Rerun latency of the Streamlit pages, measured with Streamlit's AppTest.
+
+Run against a populated database (``uv run main.py setup``):
+
+    uv run python benchmarks/rerun_latency.py [repeats]
+
+For each page it reports the first render and the median time of a rerun
+triggered by a widget change on that page.
+"""
+import os
+import sys
+import time
+import statistics
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+def change_job_map_filter(at):
+    at.checkbox[1].set_value(not at.checkbox[1].value)
+
+def change_alert_email(at):
+    at.text_input[0].set_value("bench@example.com")
+
+# Page -> widget change that triggers the measured rerun
+PAGE_INTERACTIONS = {
+    "Interactive Job Map": change_job_map_filter,
+    "Job Search": None,
+    "Spatial Analytics": None,
+    "Salary Heatmap": None,
+    "Market Intelligence": None,
+    "Job Trends": None,
+    "Job Alerts & Notifications": change_alert_email,
+    "Add Job": None,
+}
+
+def measure(page, interaction, repeats):
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    at.sidebar.selectbox[0].select(page)
+
+    start = time.perf_counter()
+    at.run()
+    first_render = time.perf_counter() - start
+
+    reruns = []
+    for _ in range(repeats):
+        if interaction is not None:
+            interaction(at)
+        start = time.perf_counter()
+        at.run()
+        reruns.append(time.perf_counter() - start)
+
+    return first_render, statistics.median(reruns)
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'Page':<30} {'first render':>14} {'median rerun':>14}")
+    for page, interaction in PAGE_INTERACTIONS.items():
+        first_render, rerun = measure(page, interaction, repeats)
+        print(f"{page:<30} {first_render * 1000:>11.1f} ms {rerun * 1000:>11.1f} ms")
+
+if __name__ == "__main__":
+    main()
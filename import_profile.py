@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+# Shorthand targets for the entry points people actually start
+IMPORT_TARGETS = {
+    "setup": "setup_db",
+    "serve": "api",
+    "app": "views.job_map",
+}
+
+def profile_imports(target="setup", top=15):
+    """Print the slowest imports of a module, measured in a fresh interpreter"""
+    module = IMPORT_TARGETS.get(target, target)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr.strip().splitlines()[-1])
+        return
+
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, self_us, cumulative_us, name = line.replace("import time:", "|", 1).split("|")
+        name = name.strip()
+        rows.append((int(cumulative_us), int(self_us), name))
+
+    total = next((row[0] for row in rows if row[2] == module), sum(row[1] for row in rows))
+    print(f"Cold import of {module}: {total / 1000:.1f} ms across {len(rows)} modules")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>9.1f} ms {self_us / 1000:>7.1f} ms  {name}")
+
+if __name__ == "__main__":
+    profile_imports(*sys.argv[1:2])
@@ -0,0 +1,325 @@
+"""Concurrent-user load test for the dashboard.
+
+Simulated analysts replay weighted session scripts (map search, filter
+changes, alert checks, adding a job) either straight against ``data``
+(mode ``data``) or through Streamlit's AppTest harness, which runs the
+real page scripts (mode ``app``). In data mode every user is a thread
+sharing the process-wide ``init_connection`` client, as sessions of one
+Streamlit server do; app mode needs a process per user because AppTest
+isn't thread-safe, so there each user has its own pool.
+
+    uv run main.py loadtest [data|app] [users, e.g. 1,8,32] [seconds]
+
+For each concurrency level it prints throughput, per-step p50/p95/p99
+latency, time spent waiting for a pooled MongoDB connection, and mongod
+CPU (from serverStatus) next to this process's CPU.
+"""
+import multiprocessing
+import os
+import random
+import threading
+import time
+from datetime import datetime
+import pymongo
+from pymongo import monitoring
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+LOAD_TEST_COMPANY = "Load Test Co"  # jobs written by the add_job step, removed afterwards
+DEFAULT_USERS = [1, 8, 32]
+DEFAULT_SECONDS = 30
+THINK_TIME_SECONDS = 0.0  # pause between steps; 0 measures saturation
+# Step -> relative weight in a session
+STEP_WEIGHTS = {"map_search": 4, "filter_change": 3, "alert_check": 2, "add_job": 1}
+
+class PoolWaitListener(monitoring.ConnectionPoolListener):
+    """Records how long each connection checkout waited on the pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.waits = []
+        self.failed = 0
+
+    def reset(self):
+        with self._lock:
+            self.waits = []
+            self.failed = 0
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.waits.append(event.duration)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.failed += 1
+
+    # The remaining pool events aren't needed
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_created(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_closed(self, event): pass
+    def connection_check_out_started(self, event): pass
+    def connection_checked_in(self, event): pass
+
+# Registered before data.init_connection creates the client, so the app's pool reports to it
+POOL_LISTENER = PoolWaitListener()
+monitoring.register(POOL_LISTENER)
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(q / 100 * len(ordered)), len(ordered) - 1)]
+
+def server_cpu_seconds(client):
+    """mongod user + system CPU seconds so far, or None if serverStatus doesn't report it"""
+    try:
+        extra = client.admin.command("serverStatus").get("extra_info", {})
+    except pymongo.errors.PyMongoError:
+        return None
+    if "user_time_us" not in extra:
+        return None
+    return (extra["user_time_us"] + extra.get("system_time_us", 0)) / 1e6
+
+class Workload:
+    """Targets and synthetic inputs shared by every simulated user"""
+
+    def __init__(self, db):
+        self.metros = [(market['city'], market['coordinates'][1], market['coordinates'][0])
+                       for market in db.market_analysis.find({}, {"city": 1, "coordinates": 1})]
+        self.metros = self.metros or [("San Francisco", 37.7749, -122.4194)]
+        self.emails = db.alerts.distinct("user_email", {"is_active": True}) or ["demo@example.com"]
+        self.categories = sorted(db.jobs.distinct("category")) or ["Software"]
+
+    def synthetic_job(self, rng):
+        city, lat, lng = rng.choice(self.metros)
+        return {
+            "title": "Load Test Engineer",
+            "company": LOAD_TEST_COMPANY,
+            "location": city,
+            "coordinates": [lng + rng.uniform(-0.1, 0.1), lat + rng.uniform(-0.1, 0.1)],
+            "salary": rng.randint(70000, 250000),
+            "job_type": "Full-time",
+            "category": rng.choice(self.categories),
+            "experience": "Mid",
+            "remote_friendly": False,
+            "posted_date": datetime.now().strftime("%Y-%m-%d"),
+            "created_at": datetime.now()
+        }
+
+class DataSession:
+    """One analyst calling the data layer the way the pages do"""
+
+    def __init__(self, workload, rng):
+        self.workload = workload
+        self.rng = rng
+
+    def map_search(self):
+        import data
+        data.get_jobs()
+        _, lat, lng = self.rng.choice(self.workload.metros)
+        data.spatial_query_jobs(round(lat, 2), round(lng, 2), self.rng.choice([10, 25, 50]))
+
+    def filter_change(self):
+        import data
+        from views.job_map import filter_job_indices
+        jobs = data.get_jobs()
+        categories = self.rng.sample(self.workload.categories, self.rng.randint(1, len(self.workload.categories)))
+        low = self.rng.choice([0, 100000, 150000])
+        filter_job_indices(data.jobs_fingerprint(jobs), sorted(categories), (low, 10 ** 7), jobs)
+
+    def alert_check(self):
+        import data
+        email = self.rng.choice(self.workload.emails)
+        for alert in data.get_user_alerts(email):
+            if alert.get('alert_type') == 'geofence':
+                data.get_alert_processor().geofence_jobs(alert)
+            elif alert.get('alert_type') == 'new_company':
+                data.check_new_company_alerts(alert)
+        data.get_user_notifications(email)
+        data.get_unread_notification_count(email)
+
+    def add_job(self):
+        import data
+        data.add_job(self.workload.synthetic_job(self.rng))
+
+class AppSession:
+    """One analyst driving the real pages through AppTest"""
+
+    def __init__(self, workload, rng):
+        from streamlit.testing.v1 import AppTest
+        self.workload = workload
+        self.rng = rng
+        self.at = AppTest.from_file(APP_PATH, default_timeout=120)
+        self.at.run()
+        self.page = None
+
+    def _open(self, page):
+        if self.page != page:
+            self.at.sidebar.selectbox[0].select(page)
+            self.at.run()
+            self.page = page
+
+    def _widget(self, widgets, label):
+        return next(widget for widget in widgets if widget.label == label)
+
+    def map_search(self):
+        self._open("Interactive Job Map")
+        radius_search = self._widget(self.at.checkbox, "Enable Radius Search")
+        if not radius_search.value:
+            radius_search.check()
+            self.at.run()
+        _, lat, lng = self.rng.choice(self.workload.metros)
+        self._widget(self.at.number_input, "Latitude").set_value(round(lat, 2))
+        self._widget(self.at.number_input, "Longitude").set_value(round(lng, 2))
+        self._widget(self.at.button, "Search Jobs").click()
+        self.at.run()
+
+    def filter_change(self):
+        self._open("Interactive Job Map")
+        clustering = self._widget(self.at.checkbox, "Enable Job Clustering")
+        clustering.set_value(not clustering.value)
+        self.at.run()
+
+    def alert_check(self):
+        self._open("Job Alerts & Notifications")
+        self._widget(self.at.text_input, "Your Email").set_value(self.rng.choice(self.workload.emails))
+        self.at.run()
+
+    def add_job(self):
+        # The Add Job form geocodes over the network; write through the data layer
+        # instead and let the next rerun of this session pick the job up
+        import data
+        data.add_job(self.workload.synthetic_job(self.rng))
+        self.at.run()
+
+def _user(session_class, workload, seed, deadline, results, lock):
+    rng = random.Random(seed)
+    try:
+        session = session_class(workload, rng)
+    except Exception as e:
+        with lock:
+            results["errors"].append(f"session start: {e!r}")
+        return
+    steps, weights = zip(*STEP_WEIGHTS.items())
+    while time.time() < deadline:
+        step = rng.choices(steps, weights)[0]
+        start = time.perf_counter()
+        try:
+            getattr(session, step)()
+        except Exception as e:
+            with lock:
+                results["errors"].append(f"{step}: {e!r}")
+            continue
+        elapsed = time.perf_counter() - start
+        with lock:
+            results["latencies"].setdefault(step, []).append(elapsed)
+            if session_class is AppSession:
+                results["errors"].extend(f"{step}: {e.value}" for e in session.at.exception)
+        if THINK_TIME_SECONDS:
+            time.sleep(THINK_TIME_SECONDS)
+
+def _app_user(workload, seed, deadline):
+    # AppTest swaps a process-global Runtime in and out around every run, so
+    # concurrent app sessions each need their own process (and connection pool)
+    results = {"latencies": {}, "errors": []}
+    process_before = time.process_time()
+    _user(AppSession, workload, seed, deadline, results, threading.Lock())
+    results["pool_waits"] = list(POOL_LISTENER.waits)
+    results["pool_failures"] = POOL_LISTENER.failed
+    results["process_cpu"] = time.process_time() - process_before
+    return results
+
+def run_level(mode, users, seconds, client, workload):
+    """Run `users` concurrent sessions for `seconds` and collect the measurements"""
+    results = {"latencies": {}, "errors": [], "pool_waits": [], "pool_failures": 0}
+    POOL_LISTENER.reset()
+
+    cpu_before = server_cpu_seconds(client)
+    process_before = time.process_time()
+    start = time.time()
+    deadline = start + seconds
+    if mode == "app":
+        with multiprocessing.get_context("spawn").Pool(users) as pool:
+            parts = pool.starmap(_app_user, [(workload, seed, deadline) for seed in range(users)])
+        for part in parts:
+            for step, values in part["latencies"].items():
+                results["latencies"].setdefault(step, []).extend(values)
+            results["errors"].extend(part["errors"])
+            results["pool_waits"].extend(part["pool_waits"])
+            results["pool_failures"] += part["pool_failures"]
+        client_cpu = sum(part["process_cpu"] for part in parts)
+    else:
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(target=_user, args=(DataSession, workload, seed, deadline, results, lock), daemon=True)
+            for seed in range(users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results["pool_waits"] = list(POOL_LISTENER.waits)
+        results["pool_failures"] = POOL_LISTENER.failed
+        client_cpu = time.process_time() - process_before
+    wall = time.time() - start
+    cpu_after = server_cpu_seconds(client)
+
+    results["users"] = users
+    results["wall"] = wall
+    results["steps"] = sum(len(values) for values in results["latencies"].values())
+    results["throughput"] = results["steps"] / wall
+    results["server_cpu"] = (cpu_after - cpu_before) / wall if None not in (cpu_before, cpu_after) else None
+    results["process_cpu"] = client_cpu / wall
+    return results
+
+def report(results):
+    server_cpu = f"{results['server_cpu']:.0%}" if results['server_cpu'] is not None else "n/a"
+    waits = results["pool_waits"]
+    print(f"\n== {results['users']} users, {results['wall']:.1f}s: {results['throughput']:.1f} steps/s, "
+          f"{len(results['errors'])} errors, mongod CPU {server_cpu}, client CPU {results['process_cpu']:.0%}")
+    print(f"   pool wait: {len(waits)} checkouts, p50 {percentile(waits, 50) * 1000:.2f} ms, "
+          f"p99 {percentile(waits, 99) * 1000:.2f} ms, max {max(waits, default=0) * 1000:.2f} ms, "
+          f"{results['pool_failures']} failed")
+    print(f"   {'step':<16} {'count':>7} {'p50':>10} {'p95':>10} {'p99':>10}")
+    for step, values in sorted(results["latencies"].items()):
+        print(f"   {step:<16} {len(values):>7} " + " ".join(
+            f"{percentile(values, q) * 1000:>7.1f} ms" for q in (50, 95, 99)))
+    for error in sorted(set(results["errors"]))[:5]:
+        print(f"   error: {error}")
+
+def cleanup(db):
+    """Remove the jobs the add_job step wrote, and what they fed"""
+    ids = [job['_id'] for job in db.jobs.find({"company": LOAD_TEST_COMPANY}, {"_id": 1})]
+    if not ids:
+        return 0
+    from geo_partitions import GeoPartitionRouter
+    router = GeoPartitionRouter(db.client)
+    db.jobs.delete_many({"company": LOAD_TEST_COMPANY})
+    for partition in router.partitions:
+        router.collection(partition).delete_many({"company": LOAD_TEST_COMPANY})
+    db.job_events.delete_many({"job_id": {"$in": ids}})
+    from job_archive import refresh_derived_state
+    refresh_derived_state(db.client)
+    return len(ids)
+
+def load_test(mode="data", users=None, seconds=DEFAULT_SECONDS):
+    """Run the workload at each concurrency level and print a report per level"""
+    import data
+    client = data.init_connection()
+    db = client.job_portal
+    workload = Workload(db)
+    data.get_jobs()  # warm the snapshot so the first level doesn't pay for it
+    levels = []
+    try:
+        for level in users or DEFAULT_USERS:
+            results = run_level(mode, level, seconds, client, workload)
+            report(results)
+            levels.append(results)
+    finally:
+        removed = cleanup(db)
+        if removed:
+            print(f"\nRemoved {removed} load-test jobs")
+    return levels
@@ -0,0 +1,197 @@
+"""Per-stage render profiling for the Streamlit pages.
+
+Enabled with ``GIS_PROFILE=1``, or per page with ``?profile=1`` when the
+server allows it with ``GIS_PROFILE_URL=1``. Pages
+wrap their stages in ``stage(name)``; app.py wraps the whole run in
+``trace(name)``. Each stage records wall time and, through tracemalloc,
+net and peak allocated memory. The last trace of the session is drawn as a
+waterfall in the sidebar, and every trace is appended to a JSONL log.
+``main.py profile-stacks`` folds that log into flame-graph input.
+
+tracemalloc is process-wide, so memory figures of sessions profiled at the
+same time include each other's allocations. It runs only while at least
+one trace is open, and stops when the last one ends.
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+import streamlit as st
+
+PROFILE_ENV = "GIS_PROFILE"
+PROFILE_URL_ENV = "GIS_PROFILE_URL"  # lets ?profile=1 turn profiling on for a page
+PROFILE_LOG = os.environ.get(
+    "GIS_PROFILE_LOG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".profile", "render_traces.jsonl")
+)
+TRACEMALLOC_FRAMES = 1
+
+_active = contextvars.ContextVar("render_trace", default=None)
+_tracing_lock = threading.Lock()
+_open_traces = 0
+_started_tracemalloc = False
+
+def _env_on(name):
+    return os.environ.get(name, "") not in ("", "0")
+
+def enabled():
+    """Profiling on via environment, or the ?profile=1 query parameter where allowed"""
+    if _env_on(PROFILE_ENV):
+        return True
+    if not _env_on(PROFILE_URL_ENV):
+        return False
+    try:
+        return st.query_params.get("profile") not in (None, "", "0")
+    except Exception:
+        return False  # no Streamlit script run (e.g. called from a command)
+
+class _Trace:
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.spans = []
+        self.stack = []
+
+    def enter(self, name):
+        current, peak = tracemalloc.get_traced_memory()
+        if self.stack:
+            # Fold the parent's peak so far in before the child resets it
+            self.stack[-1]["peak"] = max(self.stack[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+        span = {
+            "name": name,
+            "path": ";".join([*(parent["name"] for parent in self.stack), name]),
+            "depth": len(self.stack),
+            "start": time.perf_counter(),
+            "mem_start": current,
+            "peak": current,
+        }
+        self.stack.append(span)
+        return span
+
+    def exit(self, span):
+        current, peak = tracemalloc.get_traced_memory()
+        self.stack.pop()
+        span["peak"] = max(span["peak"], peak)
+        if self.stack:
+            self.stack[-1]["peak"] = max(self.stack[-1]["peak"], span["peak"])
+        tracemalloc.reset_peak()
+        self.spans.append({
+            "name": span["name"],
+            "path": span["path"],
+            "depth": span["depth"],
+            "start_ms": (span["start"] - self.started) * 1000,
+            "duration_ms": (time.perf_counter() - span["start"]) * 1000,
+            "alloc_kb": (current - span["mem_start"]) / 1024,
+            "peak_kb": (span["peak"] - span["mem_start"]) / 1024,
+        })
+
+    def record(self):
+        return {
+            "ts": datetime.now().isoformat(),
+            "trace": self.name,
+            "pid": os.getpid(),
+            "spans": sorted(self.spans, key=lambda span: span["start_ms"]),
+        }
+
+@contextmanager
+def stage(name):
+    """Time a stage of the current trace; free when profiling is off"""
+    trace_ = _active.get()
+    if trace_ is None:
+        yield
+        return
+    span = trace_.enter(name)
+    try:
+        yield
+    finally:
+        trace_.exit(span)
+
+@contextmanager
+def trace(name):
+    """Root of a trace (or a stage, inside one); logs it and keeps it for the waterfall.
+
+    Fragments rerun without app.py, so wrapping a fragment body in trace()
+    profiles those partial reruns too.
+    """
+    if _active.get() is not None:
+        with stage(name):
+            yield
+        return
+    if not enabled():
+        yield
+        return
+
+    _start_tracing()
+    trace_ = _Trace(name)
+    token = _active.set(trace_)
+    try:
+        with stage(name):
+            yield
+    finally:
+        _active.reset(token)
+        _stop_tracing()
+        record = trace_.record()
+        append_trace(record)
+        st.session_state["render_trace"] = record
+
+def _start_tracing():
+    global _open_traces, _started_tracemalloc
+    with _tracing_lock:
+        if _open_traces == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            _started_tracemalloc = True
+        _open_traces += 1
+
+def _stop_tracing():
+    # Tracing slows every allocation in the process, so it ends with the last open trace
+    global _open_traces, _started_tracemalloc
+    with _tracing_lock:
+        _open_traces -= 1
+        if _open_traces == 0 and _started_tracemalloc:
+            tracemalloc.stop()
+            _started_tracemalloc = False
+
+def append_trace(record, path=PROFILE_LOG):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+def show_waterfall():
+    """Sidebar waterfall of the session's most recent trace"""
+    record = st.session_state.get("render_trace")
+    if not enabled() or record is None:
+        return
+    import pandas as pd
+    import plotly.express as px
+
+    df = pd.DataFrame(record["spans"])
+    df["label"] = ["  " * depth + name for depth, name in zip(df["depth"], df["name"])]
+    total = df["duration_ms"].max()
+    with st.sidebar.expander(f"⏱️ Render profile: {total:.0f} ms", expanded=True):
+        st.caption(f"{record['trace']} at {record['ts'][11:19]}")
+        fig = px.bar(df, x="duration_ms", y="label", base="start_ms", orientation="h",
+                     hover_data={"alloc_kb": ":.0f", "peak_kb": ":.0f", "label": False},
+                     labels={"duration_ms": "ms", "label": ""})
+        fig.update_yaxes(autorange="reversed")
+        fig.update_layout(height=60 + 22 * len(df), margin=dict(l=0, r=0, t=10, b=0), showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(df[["label", "duration_ms", "alloc_kb", "peak_kb"]].round(1),
+                     use_container_width=True, hide_index=True)
+
+def folded_stacks(path=PROFILE_LOG):
+    """Folded 'a;b;c self_us' lines over the whole log, for flamegraph.pl or speedscope"""
+    durations, child_time = {}, {}
+    with open(path) as f:
+        for line in f:
+            for span in json.loads(line)["spans"]:
+                durations[span["path"]] = durations.get(span["path"], 0) + span["duration_ms"]
+                parent = span["path"].rpartition(";")[0]
+                if parent:
+                    child_time[parent] = child_time.get(parent, 0) + span["duration_ms"]
+    return [f"{stack} {int(max(ms - child_time.get(stack, 0), 0) * 1000)}"
+            for stack, ms in sorted(durations.items())]
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+import bson
+from gis_utils import haversine_km
+
+RESULT_CACHE_MAX_BYTES = int(os.environ.get("RESULT_CACHE_MAX_MB", 64)) * 1024 * 1024
+RESULT_CACHE_TTL = 300  # seconds; bounds staleness from writes made by other processes
+CENTER_DECIMALS = 3  # ~110 m
+RADIUS_STEP_KM = 0.1
+POLYGON_DECIMALS = 6
+MAX_ENTRY_SHARE = 4  # a single result may use at most 1/4 of the cache
+
+def quantize_radius(center_lat, center_lng, radius_km):
+    """Snap a circle to the cache grid; the snapped circle is what gets queried"""
+    steps = max(round(radius_km / RADIUS_STEP_KM), 1)
+    return round(center_lat, CENTER_DECIMALS), round(center_lng, CENTER_DECIMALS), round(steps * RADIUS_STEP_KM, 6)
+
+def polygon_hash(polygon_coords):
+    rounded = [[round(lng, POLYGON_DECIMALS), round(lat, POLYGON_DECIMALS)] for lng, lat in polygon_coords]
+    return hashlib.sha1(json.dumps(rounded).encode()).hexdigest()
+
+def _filters_key(filters):
+    return json.dumps(filters or {}, sort_keys=True, default=str)
+
+def _polygon_bbox(polygon_coords):
+    lngs = [point[0] for point in polygon_coords]
+    lats = [point[1] for point in polygon_coords]
+    if max(lngs) - min(lngs) > 180:
+        # Crosses the antimeridian (or is huge); treat it as covering everything
+        return (-90, -180, 90, 180)
+    return (min(lats), min(lngs), max(lats), max(lngs))
+
+class SpatialResultCache:
+    """LRU + TTL cache of radius and polygon search results, capped by size.
+
+    Radius searches are keyed by the quantized circle, polygon searches by a
+    hash of the rounded ring, both plus the extra filters. Each entry keeps
+    its shape so an inserted job only evicts results it could have changed:
+    circles are tested exactly, polygons by their bounding box (padded, so a
+    geodesic edge can't put a job outside it). Entry sizes are their BSON
+    size; least recently used entries go first once the byte budget is hit.
+    """
+
+    def __init__(self, max_bytes=RESULT_CACHE_MAX_BYTES, ttl=RESULT_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires, size, shape, docs)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped by every invalidation
+        self._epoch = None
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def _put(self, key, shape, docs, generation):
+        size = sum(len(bson.encode(doc)) for doc in docs)
+        if size > self.max_bytes // MAX_ENTRY_SHARE:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return  # a write landed while the query ran; the result may miss it
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, shape, docs)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[1]
+
+    def _cached(self, key, shape, compute):
+        generation = self._generation
+        docs = self._get(key)
+        if docs is None:
+            docs = compute()
+            self._put(key, shape, docs, generation)
+        # Callers get their own list; the documents themselves are shared
+        return list(docs)
+
+    def radius(self, center_lat, center_lng, radius_km, compute, filters=None):
+        """Cached compute(lat, lng, radius_km) for the quantized circle"""
+        lat, lng, radius = quantize_radius(center_lat, center_lng, radius_km)
+        key = ("radius", lat, lng, radius, _filters_key(filters))
+        return self._cached(key, ("radius", lat, lng, radius), lambda: compute(lat, lng, radius))
+
+    def polygon(self, polygon_coords, compute, filters=None):
+        """Cached compute() for a polygon ring of [lng, lat] pairs"""
+        key = ("polygon", polygon_hash(polygon_coords), _filters_key(filters))
+        return self._cached(key, ("polygon", _polygon_bbox(polygon_coords)), compute)
+
+    def _contains(self, shape, lat, lng):
+        if shape[0] == "radius":
+            _, center_lat, center_lng, radius = shape
+            return haversine_km(center_lat, center_lng, lat, lng) <= radius + 0.01
+        min_lat, min_lng, max_lat, max_lng = shape[1]
+        pad = max(max_lat - min_lat, max_lng - min_lng) * 0.01 + 1e-6
+        return min_lat - pad <= lat <= max_lat + pad and min_lng - pad <= lng <= max_lng + pad
+
+    def invalidate(self, job):
+        """Drop cached results whose shape contains the job's location"""
+        lng, lat = job['coordinates']
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if self._contains(entry[2], lat, lng)]
+            for key in stale:
+                self._drop(key)
+            self._generation += 1
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def sync(self, epoch):
+        """Clear everything when an external epoch (e.g. an archive run) moved"""
+        with self._lock:
+            if epoch == self._epoch:
+                return False
+            self._epoch = epoch
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+        return True
+
+    def stats(self):
+        """Counters plus hit rate, entry count and bytes in use"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,12 @@
+# Sidebar label -> page module; modules are imported only when selected so
+# each page pays for its own heavy imports.
+PAGES = {
+    "Interactive Job Map": "views.job_map",
+    "Job Search": "views.job_search",
+    "Spatial Analytics": "views.spatial_analytics",
+    "Salary Heatmap": "views.salary_heatmap",
+    "Market Intelligence": "views.market_intelligence",
+    "Job Trends": "views.trends",
+    "Job Alerts & Notifications": "views.job_alerts",
+    "Add Job": "views.add_job",
+}
@@ -0,0 +1,59 @@
+import streamlit as st
+from datetime import datetime, date
+from render_profile import stage
+from data import add_job, geocode_location
+
+def render():
+    st.header("➕ Add New Job")
+
+    with st.form("job_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            title = st.text_input("Job Title*")
+            company = st.text_input("Company*")
+            location = st.text_input("Location (City, State)*")
+            salary = st.number_input("Salary ($)", min_value=0, value=80000)
+            remote_friendly = st.checkbox("Remote Friendly")
+
+        with col2:
+            job_type = st.selectbox("Job Type", ["Full-time", "Part-time", "Contract", "Remote"])
+            category = st.selectbox("Category", ["Software", "Data Science", "DevOps", "Security", "Design"])
+            experience = st.selectbox("Experience Level", ["Entry", "Mid", "Senior"])
+            posted_date = st.date_input("Posted Date", value=date.today())
+
+        description = st.text_area("Job Description")
+        requirements = st.text_area("Requirements")
+
+        submitted = st.form_submit_button("🚀 Add Job")
+
+        if submitted:
+            if title and company and location:
+                with stage("geocode"):
+                    lat, lon = geocode_location(location)
+
+                if lat and lon:
+                    job_data = {
+                        "title": title,
+                        "company": company,
+                        "location": location,
+                        "coordinates": [lon, lat],
+                        "salary": salary,
+                        "job_type": job_type,
+                        "category": category,
+                        "experience": experience,
+                        "remote_friendly": remote_friendly,
+                        "description": description,
+                        "requirements": requirements,
+                        "posted_date": posted_date.isoformat(),
+                        "created_at": datetime.now()
+                    }
+
+                    with stage("insert job"):
+                        add_job(job_data)
+                    st.success("✅ Job added successfully with coordinates!")
+                    st.rerun()
+                else:
+                    st.error("❌ Could not geocode location. Please check the address.")
+            else:
+                st.error("❌ Please fill in all required fields (*)")
@@ -0,0 +1,327 @@
+import streamlit as st
+import folium
+from streamlit_folium import st_folium
+import pandas as pd
+from render_profile import stage
+from data import (
+    geocode_location, create_alert, get_user_alerts, delete_alert,
+    check_new_company_alerts,
+    get_user_notifications, get_unread_notification_count, mark_notification_read,
+    get_alert_processor
+)
+
+def render():
+    st.header("🔔 Job Alerts & Notifications")
+
+    # User email input (in real app, this would be from authentication)
+    if 'user_email' not in st.session_state:
+        st.session_state.user_email = "demo@example.com"
+
+    user_email = st.text_input("Your Email", value=st.session_state.user_email, key="user_email_input")
+    st.session_state.user_email = user_email
+
+    tab1, tab2, tab_company, tab3 = st.tabs(["📍 Geofence Alerts", "💰 Salary Alerts", "🏢 New Company Alerts", "🔔 Notifications"])
+
+    with tab1:
+        st.subheader("Set Up Geofence Alerts")
+        st.markdown("Get notified when jobs are posted in specific areas")
+
+        col1, col2 = st.columns([2, 1])
+
+        with col2:
+            with st.form("geofence_alert_form"):
+                st.markdown("**Create New Alert**")
+
+                alert_name = st.text_input("Alert Name", placeholder="e.g., SF Bay Area Jobs")
+                location_input = st.text_input("Location", placeholder="San Francisco, CA")
+
+                if st.form_submit_button("📍 Use This Location"):
+                    lat, lon = geocode_location(location_input)
+                    if lat and lon:
+                        st.session_state.alert_lat = lat
+                        st.session_state.alert_lng = lon
+                        st.success(f"Location set: {lat:.4f}, {lon:.4f}")
+                    else:
+                        st.error("Could not geocode location")
+
+                alert_lat = st.number_input("Latitude", 
+                                           value=st.session_state.get('alert_lat', 37.7749), 
+                                           format="%.4f")
+                alert_lng = st.number_input("Longitude", 
+                                           value=st.session_state.get('alert_lng', -122.4194), 
+                                           format="%.4f")
+                alert_radius = st.slider("Radius (km)", 1, 100, 25)
+
+                alert_category = st.selectbox("Category Filter (Optional)", 
+                                             ["All", "Software", "Data Science", "DevOps", "Security"])
+                alert_min_salary = st.number_input("Minimum Salary (Optional)", 
+                                                   min_value=0, value=0, step=10000)
+
+                submit_geofence = st.form_submit_button("✅ Create Geofence Alert")
+
+                if submit_geofence and alert_name and user_email:
+                    alert_data = {
+                        "user_email": user_email,
+                        "alert_name": alert_name,
+                        "alert_type": "geofence",
+                        "center_lat": alert_lat,
+                        "center_lng": alert_lng,
+                        "radius_km": alert_radius,
+                        "category": None if alert_category == "All" else alert_category,
+                        "min_salary": alert_min_salary if alert_min_salary > 0 else None,
+                        "location_name": location_input
+                    }
+                    create_alert(alert_data)
+                    st.success(f"✅ Alert '{alert_name}' created!")
+                    st.rerun()
+
+        with col1:
+            # Display map with geofence
+            st.markdown("**Your Geofence Area**")
+            m = folium.Map(
+                location=[st.session_state.get('alert_lat', 37.7749), 
+                         st.session_state.get('alert_lng', -122.4194)], 
+                zoom_start=8
+            )
+
+            # Add circle for the geofence
+            folium.Circle(
+                [st.session_state.get('alert_lat', 37.7749), 
+                 st.session_state.get('alert_lng', -122.4194)],
+                radius=25000,  # 25km in meters
+                color='red',
+                fillColor='red',
+                fillOpacity=0.2,
+                popup="Alert Geofence"
+            ).add_to(m)
+
+            st_folium(m, width=600, height=400, returned_objects=[])
+
+        # Display existing geofence alerts
+        st.markdown("---")
+        st.subheader("📋 Your Active Geofence Alerts")
+
+        with stage("fetch alerts"):
+            user_alerts = get_user_alerts(user_email)
+        geofence_alerts = [a for a in user_alerts if a.get('alert_type') == 'geofence']
+
+        if geofence_alerts:
+            for alert in geofence_alerts:
+                with st.expander(f"📍 {alert['alert_name']} - {alert.get('location_name', 'Unknown')}"):
+                    col1, col2, col3 = st.columns([2, 2, 1])
+
+                    with col1:
+                        st.write(f"**Location:** {alert['center_lat']:.4f}, {alert['center_lng']:.4f}")
+                        st.write(f"**Radius:** {alert['radius_km']} km")
+
+                    with col2:
+                        st.write(f"**Category:** {alert.get('category', 'All')}")
+                        st.write(f"**Min Salary:** ${alert.get('min_salary', 0):,}")
+
+                    with col3:
+                        if st.button("🗑️ Delete", key=f"del_geo_{alert['_id']}"):
+                            delete_alert(alert['_id'])
+                            st.success("Alert deleted!")
+                            st.rerun()
+
+                    # Check for matches
+                    if st.button(f"🔍 Check Now", key=f"check_geo_{alert['_id']}"):
+                        matches = get_alert_processor().geofence_jobs(alert)
+                        if matches:
+                            st.success(f"Found {len(matches)} matching jobs!")
+                            df = pd.DataFrame(matches)
+                            st.dataframe(df[['title', 'company', 'location', 'salary']], use_container_width=True)
+                        else:
+                            st.info("No new jobs matching your criteria")
+        else:
+            st.info("No geofence alerts yet. Create one above!")
+
+    with tab2:
+        st.subheader("💰 Salary Increase Alerts")
+        st.markdown("Get notified when average salaries increase in your target area")
+
+        with st.form("salary_alert_form"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                salary_alert_name = st.text_input("Alert Name", placeholder="e.g., SF Salary Watch")
+                salary_location = st.text_input("Location", placeholder="San Francisco, CA")
+
+                if st.form_submit_button("📍 Set Location"):
+                    lat, lon = geocode_location(salary_location)
+                    if lat and lon:
+                        st.session_state.salary_alert_lat = lat
+                        st.session_state.salary_alert_lng = lon
+                        st.success(f"Location set!")
+
+            with col2:
+                salary_alert_lat = st.number_input("Latitude", 
+                                                   value=st.session_state.get('salary_alert_lat', 37.7749), 
+                                                   format="%.4f", key="sal_lat")
+                salary_alert_lng = st.number_input("Longitude", 
+                                                   value=st.session_state.get('salary_alert_lng', -122.4194), 
+                                                   format="%.4f", key="sal_lng")
+                salary_alert_radius = st.slider("Radius (km)", 1, 100, 25, key="sal_radius")
+                target_salary = st.number_input("Target Average Salary", 
+                                               min_value=50000, value=120000, step=10000)
+
+            submit_salary = st.form_submit_button("✅ Create Salary Alert")
+
+            if submit_salary and salary_alert_name and user_email:
+                alert_data = {
+                    "user_email": user_email,
+                    "alert_name": salary_alert_name,
+                    "alert_type": "salary_increase",
+                    "center_lat": salary_alert_lat,
+                    "center_lng": salary_alert_lng,
+                    "radius_km": salary_alert_radius,
+                    "target_salary": target_salary,
+                    "location_name": salary_location
+                }
+                create_alert(alert_data)
+                st.success(f"✅ Salary alert '{salary_alert_name}' created!")
+                st.rerun()
+
+        # Display existing salary alerts
+        st.markdown("---")
+        st.subheader("📋 Your Active Salary Alerts")
+
+        salary_alerts = [a for a in user_alerts if a.get('alert_type') == 'salary_increase']
+
+        if salary_alerts:
+            for alert in salary_alerts:
+                with st.expander(f"💰 {alert['alert_name']} - Target: ${alert.get('target_salary', 0):,}"):
+                    col1, col2 = st.columns([3, 1])
+
+                    with col1:
+                        st.write(f"**Location:** {alert.get('location_name', 'Unknown')}")
+                        st.write(f"**Radius:** {alert['radius_km']} km")
+                        st.write(f"**Target Avg Salary:** ${alert.get('target_salary', 0):,}")
+
+                    with col2:
+                        if st.button("🗑️ Delete", key=f"del_sal_{alert['_id']}"):
+                            delete_alert(alert['_id'])
+                            st.success("Alert deleted!")
+                            st.rerun()
+
+                    # Check for salary increases
+                    if st.button(f"🔍 Check Now", key=f"check_sal_{alert['_id']}"):
+                        recent_jobs = get_alert_processor().recent_area_jobs(alert)
+                        avg_salary = sum(job['salary'] for job in recent_jobs) / len(recent_jobs) if recent_jobs else 0
+                        if recent_jobs and avg_salary > alert.get('target_salary', 0):
+                            st.success(f"Average salary increased to ${avg_salary:,.0f} in "
+                                       f"{alert.get('location_name') or 'your area'}")
+                            st.write(f"Based on {len(recent_jobs)} recent jobs")
+                        else:
+                            st.info("Average salary hasn't reached target yet")
+        else:
+            st.info("No salary alerts yet. Create one above!")
+
+    with tab_company:
+        st.subheader("🏢 New Company Alerts")
+        st.markdown("Get notified when a company posts its first job in your target area")
+
+        with st.form("company_alert_form"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                company_alert_name = st.text_input("Alert Name", placeholder="e.g., New Employers in Austin")
+                company_location = st.text_input("Location", placeholder="Austin, TX")
+
+                if st.form_submit_button("📍 Set Location"):
+                    lat, lon = geocode_location(company_location)
+                    if lat and lon:
+                        st.session_state.company_alert_lat = lat
+                        st.session_state.company_alert_lng = lon
+                        st.success(f"Location set!")
+
+            with col2:
+                company_alert_lat = st.number_input("Latitude", 
+                                                    value=st.session_state.get('company_alert_lat', 37.7749), 
+                                                    format="%.4f", key="comp_lat")
+                company_alert_lng = st.number_input("Longitude", 
+                                                    value=st.session_state.get('company_alert_lng', -122.4194), 
+                                                    format="%.4f", key="comp_lng")
+                company_alert_radius = st.slider("Radius (km)", 1, 100, 25, key="comp_radius")
+
+            submit_company = st.form_submit_button("✅ Create New Company Alert")
+
+            if submit_company and company_alert_name and user_email:
+                alert_data = {
+                    "user_email": user_email,
+                    "alert_name": company_alert_name,
+                    "alert_type": "new_company",
+                    "center_lat": company_alert_lat,
+                    "center_lng": company_alert_lng,
+                    "radius_km": company_alert_radius,
+                    "location_name": company_location
+                }
+                create_alert(alert_data)
+                st.success(f"✅ New company alert '{company_alert_name}' created!")
+                st.rerun()
+
+        # Display existing new company alerts
+        st.markdown("---")
+        st.subheader("📋 Your Active New Company Alerts")
+
+        company_alerts = [a for a in user_alerts if a.get('alert_type') == 'new_company']
+
+        if company_alerts:
+            for alert in company_alerts:
+                with st.expander(f"🏢 {alert['alert_name']} - {alert.get('location_name', 'Unknown')}"):
+                    col1, col2 = st.columns([3, 1])
+
+                    with col1:
+                        st.write(f"**Location:** {alert['center_lat']:.4f}, {alert['center_lng']:.4f}")
+                        st.write(f"**Radius:** {alert['radius_km']} km")
+
+                    with col2:
+                        if st.button("🗑️ Delete", key=f"del_comp_{alert['_id']}"):
+                            delete_alert(alert['_id'])
+                            st.success("Alert deleted!")
+                            st.rerun()
+
+                    # Check for new companies
+                    if st.button(f"🔍 Check Now", key=f"check_comp_{alert['_id']}"):
+                        companies = check_new_company_alerts(alert)
+                        if companies:
+                            st.success(f"Found {len(companies)} new companies!")
+                            df = pd.DataFrame(companies).rename(columns={'_id': 'company'})
+                            st.dataframe(df[['company', 'job_count', 'first_seen']], use_container_width=True)
+                        else:
+                            st.info("No new companies in this area")
+        else:
+            st.info("No new company alerts yet. Create one above!")
+
+    with tab3:
+        st.subheader("🔔 Recent Notifications")
+        with stage("fetch notifications"):
+            unread = get_unread_notification_count(user_email)
+            notifications = get_user_notifications(user_email, limit=20)
+        st.caption(f"{unread} unread")
+
+        if notifications:
+            for notif in notifications:
+                read_status = "✅" if notif.get('is_read') else "🔴"
+                with st.expander(f"{read_status} {notif.get('message', 'Notification')} - {notif['created_at'].strftime('%Y-%m-%d %H:%M')}"):
+                    st.json(notif.get('data', {}))
+
+                    if not notif.get('is_read'):
+                        if st.button("Mark as Read", key=f"read_{notif['_id']}"):
+                            mark_notification_read(user_email, notif['_id'])
+                            st.rerun()
+        else:
+            st.info("No notifications yet. Create some alerts to start receiving notifications!")
+
+        # Simulate checking all alerts
+        st.markdown("---")
+        if st.button("🔄 Check All Alerts Now"):
+            with st.spinner("Checking all your alerts..."):
+                total_matches = get_alert_processor().process(user_alerts)
+
+                if total_matches > 0:
+                    st.success(f"✅ Found {total_matches} total matches! Check notifications above.")
+                else:
+                    st.info("No new matches found at this time.")
+
+                st.rerun()
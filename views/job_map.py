@@ -0,0 +1,261 @@
+import streamlit as st
+import folium
+from streamlit_folium import st_folium
+import pandas as pd
+import numpy as np
+from render_profile import trace, stage
+from data import get_jobs, get_hub_geometry, spatial_query_jobs, search_cache_stats, jobs_fingerprint
+from vector_tiles import TILE_URL, tile_url, job_tile_options, SALARY_BANDS
+
+CLUSTER_COLORS = ['red', 'blue', 'green', 'purple', 'orange', 'darkred', 'lightred', 'beige', 'darkblue', 'darkgreen']
+DEFAULT_ZOOM = 6
+
+def hub_style(feature):
+    return {
+        'fillColor': 'lightblue',
+        'color': 'blue',
+        'weight': 2,
+        'fillOpacity': 0.3
+    }
+
+def hub_layer(zoom):
+    """Tech hubs as one GeoJSON layer, simplified for the zoom level"""
+    layer = folium.FeatureGroup(name="Tech Hubs")
+    folium.GeoJson(
+        get_hub_geometry().layer(zoom),
+        style_function=hub_style,
+        popup=folium.GeoJsonPopup(fields=["name", "avg_salary"], aliases=["Tech Hub:", "Avg Salary:"])
+    ).add_to(layer)
+    return layer
+
+def add_job_tiles(m, categories=None, salary_range=None):
+    """Draw jobs from the tile API instead of inlining a marker per job"""
+    from folium.plugins import VectorGridProtobuf
+    salary_min, salary_max = salary_range or (None, None)
+    url = tile_url("jobs", category=list(categories) if categories else None,
+                   salary_min=salary_min, salary_max=salary_max)
+    VectorGridProtobuf(url, "Jobs", job_tile_options()).add_to(m)
+
+def add_hub_tiles(m):
+    from folium.plugins import VectorGridProtobuf
+    VectorGridProtobuf(tile_url("hubs"), "Tech Hubs", {"vectorTileLayerStyles": {"hubs": {
+        "fill": True, "fillColor": "lightblue", "color": "blue", "weight": 2, "fillOpacity": 0.3
+    }}}).add_to(m)
+
+@st.cache_resource(max_entries=16)
+def build_tile_map(center, categories, salary_range):
+    """Folium map whose jobs and hubs come from vector tiles; its size doesn't grow with the jobs"""
+    m = folium.Map(location=center, zoom_start=DEFAULT_ZOOM)
+    add_hub_tiles(m)
+    add_job_tiles(m, categories, salary_range)
+    return m
+
+# Each stage is cached on its explicit inputs (the job list itself is passed
+# unhashed and identified by its fingerprint), so a filter change only
+# recomputes the stages downstream of it.
+
+@st.cache_data(max_entries=32)
+def filter_job_indices(fingerprint, selected_categories, salary_range, _jobs):
+    """Indices of jobs passing the category and salary filters"""
+    return [i for i, job in enumerate(_jobs)
+            if job['category'] in selected_categories
+            and salary_range[0] <= job['salary'] <= salary_range[1]]
+
+@st.cache_data(max_entries=32)
+def cluster_labels(fingerprint, indices, _jobs):
+    """DBSCAN cluster label per filtered job"""
+    if len(indices) < 2:
+        return [0] * len(indices)
+
+    # sklearn takes over a second to import; only pay for it when clustering is on
+    from sklearn.cluster import DBSCAN
+    coords = np.array([[_jobs[i]['coordinates'][1], _jobs[i]['coordinates'][0]] for i in indices])
+    clustering = DBSCAN(eps=0.1, min_samples=2).fit(coords)
+    return [int(label) for label in clustering.labels_]
+
+@st.cache_data(max_entries=16)
+def job_markers(fingerprint, indices, labels, _jobs):
+    """Map center and (lat, lng, color, popup html, tooltip) per filtered job"""
+    filtered_jobs = [_jobs[i] for i in indices]
+    center = [float(np.mean([job['coordinates'][1] for job in filtered_jobs])),
+              float(np.mean([job['coordinates'][0] for job in filtered_jobs]))]
+
+    markers = []
+    for n, job in enumerate(filtered_jobs):
+        color = CLUSTER_COLORS[labels[n] % len(CLUSTER_COLORS)] if labels is not None else 'blue'
+
+        popup_text = f"""
+        <b>{job['title']}</b><br>
+        Company: {job['company']}<br>
+        Salary: ${job['salary']:,}<br>
+        Type: {job['job_type']}<br>
+        Location: {job['location']}<br>
+        Remote: {'Yes' if job.get('remote_friendly') else 'No'}
+        """
+        markers.append((job['coordinates'][1], job['coordinates'][0], color, popup_text, job['title']))
+    return center, markers
+
+def build_job_map(center, markers, search_circle):
+    """Folium map with job markers and the optional search circle.
+
+    Built fresh on every run from the cached marker data: st_folium adds
+    the hub layer to the map it is given, so the map itself isn't shared.
+    """
+    m = folium.Map(location=center, zoom_start=DEFAULT_ZOOM)
+
+    # Add clustered job markers
+    for lat, lng, color, popup_text, tooltip in markers:
+        folium.CircleMarker(
+            [lat, lng],
+            radius=8,
+            popup=folium.Popup(popup_text, max_width=300),
+            tooltip=tooltip,
+            color=color,
+            fillColor=color,
+            fillOpacity=0.7
+        ).add_to(m)
+
+    # Add search radius if enabled
+    if search_circle is not None:
+        search_lat, search_lng, radius = search_circle
+        folium.Circle(
+            [search_lat, search_lng],
+            radius=radius * 1000,
+            color='red',
+            fillColor='red',
+            fillOpacity=0.1
+        ).add_to(m)
+
+    return m
+
+def render():
+    st.header("🎯 Interactive Job Map with Clustering")
+
+    # Initialize session state for jobs
+    if 'filtered_jobs_list' not in st.session_state:
+        st.session_state.filtered_jobs_list = None
+    if 'search_active' not in st.session_state:
+        st.session_state.search_active = False
+
+    if 'job_map_zoom' not in st.session_state:
+        st.session_state.job_map_zoom = DEFAULT_ZOOM
+
+    job_map_section()
+
+@st.fragment
+def job_map_section():
+    """Filters and map; widget changes here rerun only this fragment"""
+    # Fragment-only reruns skip app.py, so this starts its own trace then
+    with trace("job_map_section"):
+        job_map_body()
+
+def job_map_body():
+    col1, col2 = st.columns([3, 1])
+
+    with col2:
+        st.subheader("🔍 Spatial Filters")
+
+        # Radius search
+        search_enabled = st.checkbox("Enable Radius Search")
+        if search_enabled:
+            search_lat = st.number_input("Latitude", value=37.7749, format="%.4f")
+            search_lng = st.number_input("Longitude", value=-122.4194, format="%.4f")
+            radius = st.slider("Radius (km)", 1, 100, 25)
+            # Only current postings unless a start date is given; older ones come from the archive
+            posted_since = st.date_input("Posted since", value=None)
+
+            col_btn1, col_btn2 = st.columns(2)
+            with col_btn1:
+                if st.button("Search Jobs"):
+                    with stage("radius search"):
+                        st.session_state.filtered_jobs_list = spatial_query_jobs(
+                            search_lat, search_lng, radius, since=posted_since
+                        )
+                    st.session_state.search_active = True
+                    found = st.session_state.filtered_jobs_list
+                    archived = sum(1 for job in found if job.get('archived_at'))
+                    st.success(f"Found {len(found)} jobs within {radius}km"
+                               + (f" ({archived} archived)" if archived else ""))
+            with col_btn2:
+                if st.button("Reset Search"):
+                    st.session_state.filtered_jobs_list = None
+                    st.session_state.search_active = False
+                    st.rerun(scope="fragment")
+
+            stats = search_cache_stats()
+            if stats["hits"] + stats["misses"]:
+                st.caption(f"Search cache: {stats['hit_rate']:.0%} hit rate, "
+                           f"{stats['entries']} results, {stats['bytes'] / 1e6:.1f} MB")
+
+    # Determine which jobs to display
+    if st.session_state.search_active and st.session_state.filtered_jobs_list is not None:
+        jobs = st.session_state.filtered_jobs_list
+    else:
+        with stage("fetch jobs"):
+            jobs = get_jobs()
+    fingerprint = jobs_fingerprint(jobs)
+
+    with col2:
+        # Clustering
+        enable_clustering = st.checkbox("Enable Job Clustering", value=True)
+
+        # Filters
+        if jobs:
+            categories = sorted(set([job['category'] for job in jobs]))
+            selected_categories = st.multiselect("Categories", categories, default=categories)
+
+            salaries = [job['salary'] for job in jobs]
+            salary_range = st.slider("Salary Range",
+                                   min_value=min(salaries),
+                                   max_value=max(salaries),
+                                   value=(min(salaries), max(salaries)))
+
+    # Vector tiles draw the whole job set; a radius search result stays inline
+    use_tiles = TILE_URL is not None and not st.session_state.search_active
+
+    with col1:
+        if jobs:
+            with stage("filter"):
+                indices = filter_job_indices(fingerprint, selected_categories, salary_range, jobs)
+
+            if indices and use_tiles:
+                center = (float(np.mean([jobs[i]['coordinates'][1] for i in indices])),
+                          float(np.mean([jobs[i]['coordinates'][0] for i in indices])))
+                all_categories = set(selected_categories) == set(categories)
+                with stage("build map"):
+                    m = build_tile_map(center, None if all_categories else tuple(sorted(selected_categories)),
+                                       salary_range)
+                with stage("st_folium"):
+                    st_folium(m, width=700, height=600, key="job_map_tiles", returned_objects=[])
+                breaks = ", ".join(f"${lower // 1000}k" for lower in SALARY_BANDS[1:])
+                st.caption(f"Jobs are drawn from vector tiles, colored by salary band (breaks at {breaks}); "
+                           "clusters show with a radius search")
+            elif indices:
+                with stage("cluster (DBSCAN)"):
+                    labels = cluster_labels(fingerprint, indices, jobs) if enable_clustering else None
+                search_circle = (search_lat, search_lng, radius) if search_enabled else None
+                with stage("markers"):
+                    center, markers = job_markers(fingerprint, indices, labels, jobs)
+                with stage("build map"):
+                    m = build_job_map(center, markers, search_circle)
+
+                # Hubs go in as a separate feature group so a zoom change only
+                # swaps that layer; panning still doesn't trigger a rerun
+                zoom = st.session_state.job_map_zoom
+                with stage("hub layer"):
+                    layer = hub_layer(zoom)
+                with stage("st_folium"):
+                    output = st_folium(m, width=700, height=600, key="job_map",
+                                       feature_group_to_add=layer, returned_objects=["zoom"])
+
+                new_zoom = (output or {}).get("zoom")
+                if new_zoom is not None and new_zoom != zoom:
+                    st.session_state.job_map_zoom = new_zoom
+                    st.rerun(scope="fragment")
+
+            st.subheader(f"📊 Found {len(indices)} Jobs")
+            if indices:
+                display_cols = ['title', 'company', 'location', 'salary', 'job_type', 'category']
+                with stage("job table"):
+                    df = pd.DataFrame([jobs[i] for i in indices], columns=display_cols)
+                    st.dataframe(df, use_container_width=True)
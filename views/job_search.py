@@ -0,0 +1,94 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from pymongo.errors import OperationFailure
+from render_profile import stage
+from data import search_jobs, get_search_index_status
+from job_search import SEARCH_PAGE_SIZE
+
+def facet_options(buckets, selected):
+    # Keep selected values even when the current result has no bucket for them
+    return [value for value, _ in buckets] + [value for value in selected if value not in dict(buckets)]
+
+def reset_page():
+    st.session_state.search_page = 0
+
+def render():
+    st.header("🔎 Job Search")
+
+    if 'search_page' not in st.session_state:
+        st.session_state.search_page = 0
+
+    with st.form("search_form"):
+        col1, col2 = st.columns([3, 2])
+        with col1:
+            text = st.text_input("Keywords", placeholder="e.g. python machine learning")
+            salary_range = st.slider("Salary Range", 0, 300000, (0, 300000), step=10000)
+            remote_only = st.checkbox("Remote friendly only")
+        with col2:
+            near = st.checkbox("Near a location")
+            lat = st.number_input("Latitude", value=37.7749, format="%.4f")
+            lng = st.number_input("Longitude", value=-122.4194, format="%.4f")
+            radius_km = st.slider("Within (km, 0 = rank by distance only)", 0, 500, 50)
+        submitted = st.form_submit_button("Search")
+
+    if submitted:
+        st.session_state.search_page = 0
+
+    # Facet selections narrow the search; they come from the previous result's buckets
+    categories = tuple(st.session_state.get("search_categories", []))
+    job_types = tuple(st.session_state.get("search_job_types", []))
+    center = (lat, lng) if near else None
+
+    try:
+        with stage("$search"):
+            result = search_jobs(
+                text.strip() or None, center, radius_km if near else None, categories, job_types,
+                salary_range if salary_range != (0, 300000) else None, remote_only,
+                st.session_state.search_page
+            )
+    except OperationFailure as e:
+        st.warning(f"Search index is not ready (status: {get_search_index_status() or 'missing'}). "
+                   f"Run `uv run main.py setup` and wait for it to build.\n\n{e}")
+        return
+
+    facets = result["facets"]
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        st.metric("Matches", result["total"])
+        st.multiselect("Category", facet_options(facets.get("category", []), categories),
+                       key="search_categories", on_change=reset_page)
+        st.multiselect("Job Type", facet_options(facets.get("job_type", []), job_types),
+                       key="search_job_types", on_change=reset_page)
+
+        if facets.get("salary"):
+            df_salary = pd.DataFrame(facets["salary"], columns=["from", "jobs"])
+            df_salary["from"] = df_salary["from"].map(lambda v: f"${v / 1000:.0f}k+" if v != "other" else v)
+            st.plotly_chart(px.bar(df_salary, x="from", y="jobs", title="Salary"), use_container_width=True)
+        if facets.get("location"):
+            df_cities = pd.DataFrame(facets["location"], columns=["city", "jobs"])
+            st.dataframe(df_cities, use_container_width=True, hide_index=True)
+
+    with col2:
+        if not result["jobs"]:
+            st.info("No jobs match this search")
+            return
+
+        df = pd.DataFrame(result["jobs"])
+        display_cols = ['title', 'company', 'location', 'salary', 'job_type', 'category', 'score']
+        st.dataframe(df[[col for col in display_cols if col in df]].round({'score': 2}),
+                     use_container_width=True, hide_index=True)
+
+        pages = max((result["total"] + SEARCH_PAGE_SIZE - 1) // SEARCH_PAGE_SIZE, 1)
+        col_prev, col_page, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            if st.button("◀ Previous", disabled=st.session_state.search_page == 0):
+                st.session_state.search_page -= 1
+                st.rerun()
+        with col_page:
+            st.caption(f"Page {st.session_state.search_page + 1} of {pages}")
+        with col_next:
+            if st.button("Next ▶", disabled=st.session_state.search_page + 1 >= pages):
+                st.session_state.search_page += 1
+                st.rerun()
@@ -0,0 +1,110 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from render_profile import stage
+from data import get_market_rankings, refresh_market_scores
+
+def render():
+    st.header("🧠 Market Intelligence Dashboard")
+
+    # Scores are materialized by MarketScorer; this page only reads them
+    with stage("fetch rankings"):
+        rankings = get_market_rankings("city")
+
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        if st.button("🔄 Recompute Scores"):
+            with st.spinner("Scoring markets..."):
+                refresh_market_scores()
+            st.rerun()
+    with col1:
+        if rankings:
+            st.caption(f"Scores computed {rankings[0]['computed_at']:%Y-%m-%d %H:%M} "
+                       f"(version {rankings[0]['version']})")
+
+    if rankings:
+        df_market = pd.DataFrame(rankings)
+
+        # Market overview
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("Markets Analyzed", len(df_market))
+        with col2:
+            avg_growth = df_market['tech_job_growth'].mean()
+            st.metric("Avg Job Growth", f"{avg_growth:.1f}%")
+        with col3:
+            avg_col = df_market['cost_of_living_index'].mean()
+            st.metric("Avg COL Index", f"{avg_col:.0f}")
+        with col4:
+            avg_commute = df_market['avg_commute_time'].mean()
+            st.metric("Avg Commute", f"{avg_commute:.0f} min")
+
+        # Market comparison
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("💼 Job Growth vs Cost of Living")
+            fig = px.scatter(
+                df_market,
+                x='cost_of_living_index',
+                y='tech_job_growth',
+                size='startup_density',
+                color='city',
+                title="Market Opportunity Analysis",
+                labels={
+                    'cost_of_living_index': 'Cost of Living Index',
+                    'tech_job_growth': 'Tech Job Growth (%)'
+                }
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            st.subheader("🚗 Commute vs Startup Density")
+            fig = px.scatter(
+                df_market,
+                x='avg_commute_time',
+                y='startup_density',
+                color='city',
+                title="Work-Life Balance Analysis"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Market ranking
+        st.subheader("🏆 Market Rankings")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.dataframe(
+                df_market[['rank', 'city', 'job_count', 'median_salary', 'tech_job_growth',
+                           'cost_of_living_index', 'opportunity_score']].round(2),
+                use_container_width=True,
+                hide_index=True
+            )
+
+        with col2:
+            fig = px.bar(
+                df_market.head(8),
+                x='city',
+                y='opportunity_score',
+                title="Market Opportunity Score"
+            )
+            fig.update_xaxes(tickangle=45)
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Micro-markets: the same score over ~5 km cells
+        with stage("fetch micro-markets"):
+            cells = get_market_rankings("cell", limit=15)
+        if cells:
+            st.subheader("📍 Top Micro-Markets")
+            df_cells = pd.DataFrame(cells)
+            df_cells['lat'] = df_cells['coordinates'].str[1].round(3)
+            df_cells['lng'] = df_cells['coordinates'].str[0].round(3)
+            st.dataframe(
+                df_cells[['rank', 'city', 'lat', 'lng', 'job_count', 'median_salary', 'opportunity_score']].round(2),
+                use_container_width=True,
+                hide_index=True
+            )
+    else:
+        st.info("No market scores yet. Click 'Recompute Scores' or run `uv run main.py score-markets`.")
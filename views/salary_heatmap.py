@@ -0,0 +1,125 @@
+import streamlit as st
+import folium
+from streamlit_folium import st_folium
+import pandas as pd
+import plotly.express as px
+from render_profile import stage
+from data import get_jobs, get_salary_zones, jobs_fingerprint, zones_fingerprint, get_sketch_summary, get_city_stats, get_job_sample
+from job_sketches import APPROXIMATE_MODE_THRESHOLD
+from vector_tiles import TILE_URL, tile_url, job_tile_options
+
+MAP_SAMPLE_SIZE = 1000  # job markers drawn in approximate mode
+
+def zone_color(avg_salary):
+    return 'red' if avg_salary > 150000 else 'orange' if avg_salary > 100000 else 'green'
+
+@st.cache_resource(max_entries=4)
+def build_salary_map(fingerprint, zone_fingerprint, _jobs, _salary_zones):
+    """Folium map of salary zones and job points"""
+    m = folium.Map(location=[39.8283, -98.5795], zoom_start=4)
+
+    # Add salary zones as circles
+    for zone in _salary_zones:
+        folium.Circle(
+            [zone['center'][1], zone['center'][0]],
+            radius=zone['radius_km'] * 1000,
+            color=zone_color(zone['avg_salary']),
+            fillColor=zone_color(zone['avg_salary']),
+            fillOpacity=0.3,
+            popup=f"City: {zone['city']} (within {zone['radius_km']:.1f} km)<br>Avg Salary: ${zone['avg_salary']:,}"
+                  f"<br>Range: ${zone['min_salary']:,}–${zone['max_salary']:,}<br>Jobs: {zone['job_count']}"
+        ).add_to(m)
+
+    # Add job points
+    for job in _jobs:
+        folium.CircleMarker(
+            [job['coordinates'][1], job['coordinates'][0]],
+            radius=5,
+            color='blue',
+            fillColor='lightblue',
+            fillOpacity=0.8,
+            popup=f"{job['title']}<br>${job['salary']:,}"
+        ).add_to(m)
+
+    return m
+
+@st.cache_resource
+def build_salary_tile_map():
+    """Folium map drawing salary zones and jobs from vector tiles"""
+    from folium.plugins import VectorGridProtobuf
+    from folium.utilities import JsCode
+    m = folium.Map(location=[39.8283, -98.5795], zoom_start=4)
+    # Same thresholds as zone_color
+    VectorGridProtobuf(tile_url("salary_zones"), "Salary Zones", {"vectorTileLayerStyles": {"salary_zones": JsCode(
+        "function(p) { var c = p.avg_salary > 150000 ? 'red' : p.avg_salary > 100000 ? 'orange' : 'green'; "
+        "return {fill: true, color: c, fillColor: c, fillOpacity: 0.3, weight: 2}; }"
+    )}}).add_to(m)
+    VectorGridProtobuf(tile_url("jobs"), "Jobs", job_tile_options()).add_to(m)
+    return m
+
+@st.cache_data(max_entries=4)
+def city_salary_table(fingerprint, _jobs):
+    """Average salary and job count per city, highest paying first"""
+    df = pd.DataFrame(_jobs, columns=['location', 'salary'])
+    city_salaries = df.groupby('location')['salary'].agg(['mean', 'count']).reset_index()
+    city_salaries.columns = ['City', 'Avg Salary', 'Job Count']
+    return city_salaries.sort_values('Avg Salary', ascending=False)
+
+def render():
+    st.header("💰 Salary Heatmap Analysis")
+
+    with stage("sketch summary"):
+        sketches = get_sketch_summary()
+    approximate = st.toggle(
+        "Approximate mode", value=sketches['total_jobs'] > APPROXIMATE_MODE_THRESHOLD,
+        help="Map a uniform sample of jobs and read city figures and salary quantiles "
+             "from counters and sketches kept up to date at ingest"
+    ) and sketches['total_jobs'] > 0
+
+    with stage("fetch jobs"):
+        # The sample comes from the reservoir; the full job list isn't needed
+        jobs = get_job_sample(MAP_SAMPLE_SIZE) if approximate else get_jobs()
+    with stage("fetch salary zones"):
+        salary_zones = get_salary_zones()
+
+    if jobs and salary_zones:
+        fingerprint = jobs_fingerprint(jobs)
+
+        # Create salary heatmap
+        with stage("build map"):
+            m = build_salary_tile_map() if TILE_URL else build_salary_map(fingerprint, zones_fingerprint(salary_zones), jobs, salary_zones)
+        with stage("st_folium"):
+            st_folium(m, width=700, height=500, returned_objects=[])
+
+        # Salary statistics
+        with stage("city table"):
+            if approximate:
+                city_salaries = pd.DataFrame(get_city_stats(), columns=['city', 'avg_salary', 'count'])
+                city_salaries.columns = ['City', 'Avg Salary', 'Job Count']
+                city_salaries = city_salaries.sort_values('Avg Salary', ascending=False)
+            else:
+                city_salaries = city_salary_table(fingerprint, jobs)
+
+        if approximate:
+            quantiles = sketches['salary_quantiles']
+            cols = st.columns(len(quantiles))
+            for col, (q, (low, value, high)) in zip(cols, quantiles.items()):
+                col.metric(f"P{q * 100:.0f} Salary", f"${value:,.0f}", help=f"Between ${low:,.0f} and ${high:,.0f}")
+            st.caption(f"≈ Map shows {len(jobs):,} sampled of {sketches['total_jobs']:,} jobs; salary percentiles "
+                       f"come from a t-digest (ranges are its rank error). City averages are exact.")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("📊 Salary Distribution by City")
+            st.dataframe(city_salaries, use_container_width=True)
+
+        with col2:
+            st.subheader("🎯 Top Paying Locations")
+            fig = px.bar(
+                city_salaries.head(10),
+                x='City',
+                y='Avg Salary',
+                title="Average Salary by City"
+            )
+            fig.update_xaxes(tickangle=45)
+            st.plotly_chart(fig, use_container_width=True)
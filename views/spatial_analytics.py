@@ -0,0 +1,217 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from render_profile import stage
+from data import get_jobs, get_analysis_executor, jobs_fingerprint, get_sketch_summary, get_job_sample
+from job_sketches import APPROXIMATE_MODE_THRESHOLD
+from vector_tiles import TILE_URL, tile_url, band_layers, BAND_COLORS, SALARY_BANDS
+
+CLUSTER_POLL_SECONDS = 1
+
+@st.cache_data(max_entries=4)
+def spatial_summary(fingerprint, _jobs):
+    """Headline metrics for the jobs"""
+    df = pd.DataFrame(_jobs, columns=['location'])
+    city_counts = df['location'].value_counts()
+
+    # Geographic spread
+    lats = [job['coordinates'][1] for job in _jobs]
+    lngs = [job['coordinates'][0] for job in _jobs]
+    spread = ((max(lats) - min(lats)) + (max(lngs) - min(lngs))) / 2
+
+    return {
+        'total_jobs': len(_jobs),
+        'unique_cities': df['location'].nunique(),
+        'top_city': city_counts.index[0],
+        'top_city_count': int(city_counts.iloc[0]),
+        'spread': spread
+    }
+
+@st.cache_resource(max_entries=4)
+def salary_distribution_figure(fingerprint, _jobs):
+    """Scattermapbox of jobs sized and colored by salary"""
+    fig = go.Figure(data=go.Scattermapbox(
+        lat=[job['coordinates'][1] for job in _jobs],
+        lon=[job['coordinates'][0] for job in _jobs],
+        mode='markers',
+        marker=dict(
+            size=[job['salary']/5000 for job in _jobs],
+            color=[job['salary'] for job in _jobs],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title="Salary")
+        ),
+        text=[f"{job['title']}<br>${job['salary']:,}" for job in _jobs],
+        hovertemplate='%{text}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        mapbox=dict(
+            style="open-street-map",
+            center=dict(lat=39.8283, lon=-98.5795),
+            zoom=3
+        ),
+        height=400,
+        title="Job Salary Distribution Map"
+    )
+    return fig
+
+@st.cache_resource
+def salary_tile_figure():
+    """The salary map drawn from job vector tiles: one circle layer per salary band"""
+    # Stepped colorbar matching the bands; the open top band is drawn as wide as the one below it
+    top = 2 * SALARY_BANDS[-1] - SALARY_BANDS[-2]
+    edges = [*SALARY_BANDS, top]
+    colorscale = [[edges[n + i] / top, color] for n, color in enumerate(BAND_COLORS) for i in (0, 1)]
+    fig = go.Figure(go.Scattermapbox(
+        # No points of its own; only carries the band colorbar
+        lat=[None], lon=[None], mode='markers',
+        marker=dict(
+            color=[SALARY_BANDS[0]],
+            colorscale=colorscale,
+            cmin=0, cmax=top,
+            showscale=True,
+            colorbar=dict(title="Salary")
+        ),
+        hoverinfo='skip'
+    ))
+    fig.update_layout(
+        mapbox=dict(
+            style="open-street-map",
+            center=dict(lat=39.8283, lon=-98.5795),
+            zoom=3,
+            layers=[dict(sourcetype="vector", source=[tile_url("jobs")], sourcelayer=layer,
+                         type="circle", color=color, circle=dict(radius=4))
+                    for layer, color in zip(band_layers(), BAND_COLORS)]
+        ),
+        height=400,
+        title="Job Salary Distribution Map"
+    )
+    return fig
+
+def cluster_chart(labels, sampled=False):
+    """Bar chart of jobs per cluster; sampled charts count the sample's jobs as they are"""
+    cluster_counts = pd.Series(labels).value_counts()
+    cluster_counts = cluster_counts[cluster_counts.index != -1]  # Remove noise
+
+    if len(cluster_counts) == 0:
+        st.info("No significant clusters found")
+        return
+    fig = px.bar(
+        x=cluster_counts.index,
+        y=cluster_counts.values,
+        title="Job Clusters",
+        labels={'x': 'Cluster ID', 'y': 'Sampled Jobs in Cluster' if sampled else 'Jobs in Cluster'}
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+def cluster_panel(cluster_key=None, sample_key=None, polling=False):
+    """Draw the cluster chart once DBSCAN is done; while exact clustering
+    runs, or when only the sample was submitted, show the sample's clusters"""
+    executor = get_analysis_executor()
+    key = cluster_key or sample_key
+    status = executor.status(key)
+    if status in ("pending", "running"):
+        if cluster_key is not None and sample_key is not None and executor.status(sample_key) == "done":
+            cluster_chart(executor.result(sample_key), sampled=True)
+            st.caption("≈ Clusters of the job sample; exact clustering is running in the background")
+        else:
+            st.info("⏳ Clustering jobs in the background...")
+        return
+    if polling:
+        # Finished between polls: a full rerun redraws the panel without the timer
+        st.rerun()
+    if status == "failed":
+        st.error("Clustering failed, reload the page to retry")
+        return
+
+    cluster_chart(executor.result(key), sampled=cluster_key is None)
+    if cluster_key is None:
+        st.caption("≈ Clusters of the job sample; turn on exact clustering to cluster every job")
+
+def show_job_clusters(cluster_key=None, sample_key=None):
+    """Cluster panel as a fragment that polls the analysis pool only while the task is unfinished"""
+    polling = get_analysis_executor().status(cluster_key or sample_key) in ("pending", "running")
+    panel = st.fragment(cluster_panel, run_every=CLUSTER_POLL_SECONDS if polling else None)
+    panel(cluster_key, sample_key, polling)
+
+def render():
+    st.header("📈 Advanced Spatial Analytics")
+
+    with stage("sketch summary"):
+        sketches = get_sketch_summary()
+    approximate = st.toggle(
+        "Approximate mode", value=sketches['total_jobs'] > APPROXIMATE_MODE_THRESHOLD,
+        help="Headline numbers from streaming sketches and charts from a uniform job sample, "
+             "with error bounds; exact clustering runs in the background on request"
+    )
+
+    # Approximate mode reads only the sketches and the sample; the full job
+    # set is loaded when exact clustering is asked for
+    if approximate and sketches['total_jobs']:
+        summary = sketches
+        with stage("fetch sample"):
+            sample = get_job_sample()
+        jobs, plotted = None, sample
+    else:
+        with stage("fetch jobs"):
+            jobs = get_jobs()
+        if not jobs:
+            return
+        with stage("summary"):
+            summary = spatial_summary(jobs_fingerprint(jobs), jobs)
+        sample, plotted = None, jobs
+
+    # Spatial statistics
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Total Jobs", summary['total_jobs'])
+        st.metric("Unique Cities", summary['unique_cities'])
+
+    with col2:
+        # Calculate job density by city
+        st.metric("Highest Density", f"{summary['top_city']} ({summary['top_city_count']})")
+
+    with col3:
+        st.metric("Geographic Spread", f"{summary['spread']:.2f}°")
+
+    if sample is not None:
+        low, median, high = summary['salary_quantiles'][0.5]
+        st.caption(
+            f"≈ {summary['companies']:,.0f} companies (±{summary['companies_error']:.1%}), "
+            f"median salary ${median:,.0f} (${low:,.0f}–${high:,.0f}); counts, cities and spread are exact. "
+            f"Charts use a sample of {len(sample):,} of {summary['total_jobs']:,} jobs."
+        )
+
+    # Distance analysis
+    st.subheader("🎯 Distance-Based Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Job density heatmap
+        with stage("salary map"):
+            fig = salary_tile_figure() if TILE_URL else salary_distribution_figure(jobs_fingerprint(plotted), plotted)
+            st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        # Nearest neighbor analysis
+        st.subheader("🔍 Spatial Clustering Analysis")
+
+        # DBSCAN runs in the analysis process pool; poll until it lands
+        with stage("submit clustering"):
+            executor = get_analysis_executor()
+            cluster_key = sample_key = None
+            if sample is not None:
+                # A sample is sparser by len(sample)/total, so scale the neighbours a
+                # core point needs by the same ratio, keeping at least two
+                min_samples = max(2, round(3 * len(sample) / summary['total_jobs']))
+                sample_key = executor.submit("cluster", executor.publish(sample), eps=0.5, min_samples=min_samples)
+                if st.toggle("Exact clustering", help="Cluster every job in the background; loads the full job set"):
+                    with stage("fetch jobs"):
+                        jobs = get_jobs()
+            if jobs:
+                cluster_key = executor.submit("cluster", executor.publish(jobs), eps=0.5, min_samples=3)
+        show_job_clusters(cluster_key, sample_key)
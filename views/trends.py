@@ -0,0 +1,93 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from datetime import datetime, timedelta, time
+from render_profile import stage
+from data import (
+    get_history_bounds, get_history_cities, get_posting_trends, get_salary_trends, get_category_trends,
+    get_archive_watermark, get_archive_rollups
+)
+
+def render():
+    st.header("📅 Job Posting Trends")
+
+    first, last = get_history_bounds()
+    if first is None:
+        st.info("No job history yet. Run `uv run main.py setup` to backfill it.")
+        return
+
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        date_range = st.date_input(
+            "Date range",
+            value=(first.date(), last.date()),
+            min_value=first.date(),
+            max_value=last.date()
+        )
+    with col2:
+        cities = st.multiselect("Cities (all if empty)", get_history_cities())
+    with col3:
+        window_days = st.slider("Moving average (days)", 1, 30, 7)
+
+    if len(date_range) != 2:
+        st.info("Pick an end date")
+        return
+
+    # Whole days, end inclusive; only job_events buckets in this range are read
+    start = datetime.combine(date_range[0], time.min)
+    end = datetime.combine(date_range[1] + timedelta(days=1), time.min)
+    with stage("postings per day"):
+        postings = get_posting_trends(start, end, tuple(cities))
+
+    if not postings:
+        st.info("No postings in this range")
+        return
+
+    df_postings = pd.DataFrame(postings)
+    daily_totals = df_postings.groupby('day')['postings'].sum()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Postings", int(daily_totals.sum()))
+    with col2:
+        st.metric("Busiest Day", f"{daily_totals.idxmax():%Y-%m-%d} ({daily_totals.max()})")
+    with col3:
+        st.metric("Avg Postings / Day", f"{daily_totals.mean():.1f}")
+
+    st.subheader("📈 Postings per Day")
+    fig = px.line(df_postings, x='day', y='postings', color='city', markers=True)
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader(f"💰 Salary, {window_days}-Day Moving Average")
+    with stage("salary moving average"):
+        df_salary = pd.DataFrame(get_salary_trends(start, end, window_days, tuple(cities)))
+    fig = px.line(
+        df_salary,
+        x='day',
+        y='moving_avg_salary',
+        color='city',
+        labels={'moving_avg_salary': 'Avg Salary ($)'}
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("🧩 Weekly Category Mix")
+    with stage("category mix"):
+        df_categories = pd.DataFrame(get_category_trends(start, end, tuple(cities)))
+    fig = px.bar(df_categories, x='period', y='postings', color='category')
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Archived jobs are summarized by month; only shown when the range reaches them
+    watermark = get_archive_watermark()
+    if watermark is not None and date_range[0].isoformat() < watermark:
+        st.subheader("🗄️ Archived Postings by Month")
+        with stage("archive rollups"):
+            rollups = get_archive_rollups(date_range[0], date_range[1], tuple(cities))
+        if rollups:
+            df_archive = pd.DataFrame(rollups)
+            df_monthly = df_archive.groupby(['month', 'city'], as_index=False).agg(
+                postings=('postings', 'sum'), salary_sum=('salary_sum', 'sum')
+            )
+            df_monthly['avg_salary'] = df_monthly['salary_sum'] / df_monthly['postings']
+            fig = px.bar(df_monthly, x='month', y='postings', color='city', hover_data={'avg_salary': ':,.0f'})
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption(f"Jobs posted before {watermark} live in the archive; these are their monthly rollups.")